@@ -2,9 +2,38 @@
 Ansible Module that utilizes the python requests library
 """
 
+import asyncio
+import base64
+import datetime
+import functools
 import json
+import os
+import re
+import socket
+import ssl
+import tempfile
+import time
+import traceback
 import requests
-from ansible.module_utils.basic import AnsibleModule
+import urllib3
+from requests.adapters import HTTPAdapter
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    import aiohttp
+except ImportError:
+    HAS_AIOHTTP = False
+    AIOHTTP_IMPORT_ERROR = traceback.format_exc()
+else:
+    HAS_AIOHTTP = True
+    AIOHTTP_IMPORT_ERROR = None
 
 
 DOCUMENTATION = """
@@ -19,6 +48,9 @@ author: James Williams (@packetgeeknet)
 requirements:
     - requests
     - json
+    - aiohttp (only when url is a list)
+    - orjson (optional, faster JSON parsing)
+    - httpx[http2] (only when backend is httpx)
 options:
     method:
         description: method for the new Request object
@@ -33,7 +65,9 @@ options:
         required: False
         default: GET
     url:
-        description: URL for the new Request object
+        description:
+            - URL for the new Request object. When a list of URLs is given, the requests are sent
+              concurrently with aiohttp and the per-URL responses are returned in C(results).
         required: True
     params:
         description: Dictionary, list of tuples or bytes to send in the query string for the Request.
@@ -98,7 +132,7 @@ options:
     stream:
         description: if False, the response content will be immediately downloaded.
         required: False
-        default: True
+        default: False
     cert_key:
         description: Tuple of (‘cert’, ‘key’) pair
         required: False
@@ -107,6 +141,53 @@ options:
         description: Srring of path to ssl client cert file (.pem)
         required: False
         default: null
+    etag:
+        description:
+            - ETag from a previous response. Sent as the If-None-Match header so the server can reply
+              with HTTP 304 when the resource is unchanged.
+        required: False
+        default: null
+    last_modified:
+        description:
+            - Last-Modified value from a previous response. Sent as the If-Modified-Since header so the
+              server can reply with HTTP 304 when the resource is unchanged.
+        required: False
+        default: null
+    return_content:
+        description: Boolean. Return the response body, base64 encoded, in C(content).
+        required: False
+        default: False
+    return_text:
+        description: Boolean. Return the decoded response body in C(text).
+        required: False
+        default: False
+    return_json:
+        description: Boolean. Parse the response body as JSON and return it in C(json).
+        required: False
+        default: False
+    backend:
+        description:
+            - HTTP client used for a single URL. httpx speaks HTTP/2, so requests to the same origin
+              share one multiplexed connection. proxies, stream and dest_path are not supported
+              with httpx.
+        choices:
+        - requests
+        - httpx
+        required: False
+        default: requests
+    dns_cache:
+        description:
+            - Boolean. Cache host name lookups for 300 seconds when the requests backend opens new
+              connections, so reconnecting after the pool drops a connection does not query DNS again.
+        required: False
+        default: False
+    dest_path:
+        description:
+            - Path of a file to write the response body to in 64 KiB chunks, without holding the whole
+              body in memory. Requires stream to be True and return_content, return_text and return_json
+              to be False.
+        required: False
+        default: null
 """
 EXAMPLES = """
 - jtdub.requests.uri:
@@ -117,6 +198,11 @@ EXAMPLES = """
     url: https://bgpstuff.net/totals?format=json
     headers:
       Content-type: "application/json"
+- jtdub.requests.uri:
+    method: GET
+    url:
+      - https://google.com/
+      - https://bgpstuff.net/totals?format=json
 """
 RETURN = """
 changed:
@@ -124,17 +210,20 @@ changed:
     type: boolean
     sample: True
 content:
-    description: Response value in bytes
-    type: bytes
+    description: Response body encoded as base64, returned when return_content is True
+    type: string
 cookies:
     description: Respsonse cookies
     type: dictionary
 elapsed:
-    description: Elapsed time of request in microseconds
+    description: Elapsed time of request in microseconds, full precision
     type: integer
 encoding:
     description: Response encoding
     type: string
+etag:
+    description: Response ETag header, to be passed back as the etag option on the next request
+    type: string
 headers:
     description: Response Headers
     type: dictionary
@@ -148,8 +237,11 @@ is_redirect:
     description: Response with HTTP 30x
     type: boolean
 json:
-    description: Response with JSON content
+    description: Response with JSON content, returned when return_json is True
     type: dictionary
+last_modified:
+    description: Response Last-Modified header, to be passed back as the last_modified option on the next request
+    type: string
 links:
     description: Response with URL links
     type: dictionary
@@ -159,6 +251,14 @@ next:
 ok:
     description: Request ok?
     type: boolean
+dest_path:
+    description: Path the response body was written to, returned when dest_path is set
+    type: string
+results:
+    description:
+        - List of per-URL responses when url is a list. Each entry contains url, status_code, reason,
+          ok, headers and the content, text and json keys selected by the return_* options.
+    type: list
 reason:
     description: Response reason
     type: string
@@ -168,7 +268,7 @@ status_code:
     type: integer
     sample: 200
 text:
-    description: Response text
+    description: Response text, returned when return_text is True
     type: string
 url:
     description: URL sent in request
@@ -180,112 +280,478 @@ verify:
 """
 
 
-def main():  # pylint: disable=too-many-locals
-    """requests-uri main function"""
-    module = AnsibleModule(
-        argument_spec=dict(
-            method=dict(
-                required=False,
-                type=str,
-                choices=["GET", "POST", "OPTIONS", "HEAD", "PUT", "PATCH", "DELETE"],
-                default="GET",
+# Any integer outside the 64-bit range has at least 19 digits.
+_LONG_NUMBER = re.compile(rb"\d{19}")
+
+
+def _loads(body):
+    """Parse a JSON response body straight from bytes, returning None if it is not JSON"""
+    # orjson rejects a BOM and NaN and silently turns integers wider than 64 bits into floats,
+    # so those bodies go through the stdlib parser to match resp.json().
+    if HAS_ORJSON and not _LONG_NUMBER.search(body):
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def _decode(body, encoding):
+    """Decode a response body once, without falling back to charset detection"""
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _build_session():
+    """Build a requests Session with a pooled adapter mounted for http and https"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Created once per interpreter so repeated calls to the same host reuse pooled connections.
+_SESSION = _build_session()
+
+_DNS_TTL = 300
+_CREATE_CONNECTION = urllib3.util.connection.create_connection
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(host, port, ttl_hash):  # pylint: disable=unused-argument
+    """Resolve host and port once per TTL window; ttl_hash changes every _DNS_TTL seconds"""
+    family = urllib3.util.connection.allowed_gai_family()
+    return socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+
+
+def _cached_create_connection(address, *args, **kwargs):
+    """urllib3 create_connection replacement that connects to the cached addresses for a host"""
+    host, port = address
+    error = OSError("getaddrinfo returns an empty list")
+    for *_, sockaddr in _resolve(host, port, int(time.monotonic() // _DNS_TTL)):
+        address = sockaddr[0]
+        if len(sockaddr) == 4 and sockaddr[3]:
+            # Keep the scope id of link-local IPv6 addresses.
+            address = f"{address}%{sockaddr[3]}"
+        try:
+            return _CREATE_CONNECTION((address, port), *args, **kwargs)
+        except OSError as exc:
+            error = exc
+    raise error
+
+
+# httpx binds TLS settings to the client, so clients are cached per (verify, cert).
+_HTTPX_CLIENTS = {}
+
+
+def _httpx_client(verify, cert):
+    """Return the cached HTTP/2 httpx client for the given TLS settings"""
+    import httpx  # pylint: disable=import-outside-toplevel
+
+    key = (verify, tuple(cert) if isinstance(cert, list) else cert)
+    if key not in _HTTPX_CLIENTS:
+        _HTTPX_CLIENTS[key] = httpx.Client(
+            http2=True,
+            verify=verify,
+            cert=key[1],
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _HTTPX_CLIENTS[key]
+
+
+def _httpx_to_requests(resp, history=True):
+    """Wrap an httpx response in a requests Response so both backends share the result handling"""
+    converted = requests.Response()
+    converted._content = resp.read()  # pylint: disable=protected-access
+    converted._content_consumed = True  # pylint: disable=protected-access
+    converted.status_code = resp.status_code
+    # Join repeated headers with ", " the way urllib3 does for the requests backend.
+    headers = {}
+    for key, value in resp.headers.raw:
+        key, value = key.decode("latin-1"), value.decode("latin-1")
+        if key.lower() in headers:
+            key, value = headers[key.lower()][0], f"{headers[key.lower()][1]}, {value}"
+        headers[key.lower()] = (key, value)
+    converted.headers = requests.structures.CaseInsensitiveDict(headers.values())
+    converted.url = str(resp.url)
+    converted.reason = resp.reason_phrase
+    converted.encoding = requests.utils.get_encoding_from_headers(converted.headers)
+    converted.elapsed = resp.elapsed
+    converted.cookies = requests.cookies.cookiejar_from_dict(dict(resp.cookies))
+    if history:
+        converted.history = [_httpx_to_requests(x, history=False) for x in resp.history]
+    return converted
+
+
+def _httpx_request(method, url, options):
+    """Send a single request through the cached httpx client"""
+    client = _httpx_client(options.pop("verify"), options.pop("cert"))
+    # The client is shared across calls in a persistent interpreter; never replay old cookies.
+    client.cookies.clear()
+    cookies = options.pop("cookies")
+    if cookies:
+        # Per-request cookies are deprecated in httpx, so send them as a Cookie header.
+        cookie = "; ".join(f"{key}={value}" for key, value in cookies.items())
+        headers = requests.structures.CaseInsensitiveDict(options["headers"] or {})
+        headers["Cookie"] = f"{headers['Cookie']}; {cookie}" if "Cookie" in headers else cookie
+        options["headers"] = headers
+    data = options.pop("data")
+    if isinstance(data, (bytes, str)):
+        options["content"] = data
+    else:
+        options["data"] = data
+    return _httpx_to_requests(client.request(method, url, **options))
+
+
+def _send_httpx(module, data, headers, cert):
+    """Send the single-URL request with the httpx backend and return a requests style response"""
+    params = module.params
+    if params["proxies"]:
+        module.fail_json(msg="proxies is not supported with the httpx backend")
+    username = params["username"]
+    password = params["password"]
+    try:
+        return _httpx_request(
+            params["method"],
+            params["url"],
+            dict(
+                params=params["params"],
+                data=data,
+                headers=headers,
+                cookies=params["cookies"],
+                files=params["files"],
+                auth=(username, password) if username and password else None,
+                timeout=params["timeout"],
+                follow_redirects=params["allow_redirects"],
+                verify=params["verify"],
+                cert=cert,
             ),
-            url=dict(required=True, type="str"),
-            params=dict(required=False, type="raw", default=None),
-            data=dict(required=False, type="raw", default=None),
-            json=dict(required=False, type="json", default=None),
-            headers=dict(required=False, type="dict", default=None),
-            cookies=dict(required=False, type="dict", default=None),
-            files=dict(required=False, type="dict", default=None),
-            username=dict(required=False, type="str", default=None),
-            password=dict(required=False, type="str", default=None, no_log=True),
-            timeout=dict(required=False, type="float", default=None),
-            allow_redirects=dict(required=False, type="bool", default=True),
-            proxies=dict(required=False, type="dict", default=None),
-            verify=dict(required=False, type="bool", default=True),
-            stream=dict(required=False, type="bool", default=True),
-            cert_key=dict(required=False, type="tuple", default=None),
-            cert_file=dict(required=False, type="str", default=None),
+        )
+    except ImportError:
+        msg = missing_required_lib("httpx[http2]")
+        return module.fail_json(msg=msg, exception=traceback.format_exc())
+
+
+def _batch_ssl(verify, cert):
+    """Translate requests style verify/cert options to an aiohttp ssl argument"""
+    if not cert:
+        return None if verify else False
+    context = ssl.create_default_context()
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if isinstance(cert, (list, tuple)):
+        context.load_cert_chain(*cert)
+    else:
+        context.load_cert_chain(cert)
+    return context
+
+
+def _batch_request(method, urls, proxies, options):
+    """Send one request per URL concurrently with aiohttp and return per-URL result dicts"""
+    return_content = options.pop("return_content")
+    return_text = options.pop("return_text")
+    return_json = options.pop("return_json")
+
+    async def fetch(session, url):
+        proxy = requests.utils.select_proxy(url, proxies)
+        try:
+            async with session.request(method, url, proxy=proxy, **options) as resp:
+                result = dict(
+                    url=str(resp.url),
+                    status_code=resp.status,
+                    reason=resp.reason,
+                    ok=resp.status < 400,
+                    headers=dict(resp.headers),
+                )
+                if return_content or return_text or return_json:
+                    body = await resp.read()
+                    if return_content:
+                        result["content"] = base64.b64encode(body).decode("ascii")
+                    if return_text:
+                        result["text"] = _decode(body, resp.charset)
+                    if return_json:
+                        result["json"] = _loads(body)
+                return result
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            # Report the failure against this URL instead of discarding every other result.
+            return dict(url=url, status_code=None, ok=False, msg=str(exc) or type(exc).__name__)
+
+    async def main_async():
+        connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(*(fetch(session, url) for url in urls))
+
+    return asyncio.run(main_async())
+
+
+def _run_batch(module, data, headers, cert):
+    """Send every URL in the url list with aiohttp and exit with the per-URL results"""
+    params = module.params
+    if not HAS_AIOHTTP:
+        module.fail_json(msg=missing_required_lib("aiohttp"), exception=AIOHTTP_IMPORT_ERROR)
+    for option in ("files", "dest_path"):
+        if params[option]:
+            module.fail_json(msg=f"{option} is not supported when url is a list")
+
+    username = params["username"]
+    password = params["password"]
+    results = _batch_request(
+        params["method"],
+        params["url"],
+        params["proxies"],
+        dict(
+            params=params["params"],
+            data=data,
+            headers=headers,
+            cookies=params["cookies"],
+            auth=aiohttp.BasicAuth(username, password) if username and password else None,
+            timeout=aiohttp.ClientTimeout(total=params["timeout"]),
+            allow_redirects=params["allow_redirects"],
+            ssl=_batch_ssl(params["verify"], cert),
+            return_content=params["return_content"],
+            return_text=params["return_text"],
+            return_json=params["return_json"],
         ),
-        supports_check_mode=False,
-        required_together=["username", "password"],
-        mutually_exclusive=["cert_key", "cert_file"],
     )
-    method = module.params["method"]
-    url = module.params["url"]
-    params = module.params["params"]
-    data = module.params["data"]
-    param_json = json.loads(module.params["json"]) if module.params["json"] else None
-    headers = module.params["headers"]
-    cookies = module.params["cookies"]
-    files = module.params["files"]
-    username = module.params["username"]
-    password = module.params["password"]
-    auth = (username, password) if username and password else None
-    timeout = module.params["timeout"]
-    allow_redirects = module.params["allow_redirects"]
-    proxies = module.params["proxies"]
-    verify = module.params["verify"]
-    stream = module.params["stream"]
+    failed = [x["url"] for x in results if not x["ok"]]
+    if failed:
+        module.fail_json(msg=f"request failed for {', '.join(failed)}", results=results)
+    module.exit_json(
+        changed=params["method"] in _MUTATING,
+        method=params["method"],
+        results=results,
+        verify=params["verify"],
+    )
 
-    if module.params["cert_key"]:
-        cert = module.params["cert_key"]
-    elif module.params["cert_file"]:
-        cert = module.params["cert_file"]
-    else:
-        cert = None
 
-    resp = requests.request(
-        method=method,
-        url=url,
-        params=params,
+def _check_params(module):
+    """Fail on option combinations the argument spec cannot express"""
+    params = module.params
+    url = params["url"]
+    if not isinstance(url, str) and not (
+        isinstance(url, list) and all(isinstance(x, str) for x in url)
+    ):
+        module.fail_json(msg="url must be a string or a list of strings")
+    if params["json"]:
+        # type="json" passes strings through unchecked, and the body is sent without re-encoding.
+        try:
+            json.loads(params["json"])
+        except ValueError as exc:
+            module.fail_json(msg=f"json is not valid JSON: {exc}")
+    if params["backend"] == "httpx":
+        for option in ("stream", "dest_path"):
+            if params[option]:
+                module.fail_json(msg=f"{option} is not supported with the httpx backend")
+    returns_body = params["return_content"] or params["return_text"] or params["return_json"]
+    if params["dest_path"] and (not params["stream"] or returns_body):
+        module.fail_json(
+            msg="dest_path requires stream=True and return_content, return_text and return_json "
+            "to be False"
+        )
+
+
+def _prepare_request(params):
+    """Return the request body and headers after applying the json and conditional GET options"""
+    data = params["data"]
+    headers = params["headers"]
+
+    # The json option arrives already serialized, so send it as the body as-is
+    # rather than decoding it and letting requests encode it again. Like requests,
+    # json is ignored when data or files are given.
+    if params["json"] and not data and not params["files"]:
+        data = params["json"].encode("utf-8")
+        if not any(key.lower() == "content-type" for key in headers or {}):
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+
+    if params["etag"] or params["last_modified"]:
+        headers = dict(headers or {})
+        if params["etag"]:
+            headers["If-None-Match"] = params["etag"]
+        if params["last_modified"]:
+            headers["If-Modified-Since"] = params["last_modified"]
+    return data, headers
+
+
+def _send_requests(module, data, headers, cert):
+    """Send the single-URL request through the shared requests Session"""
+    params = module.params
+    username = params["username"]
+    password = params["password"]
+    # The session is shared across calls in a persistent interpreter; never replay old cookies.
+    _SESSION.cookies.clear()
+    return _SESSION.request(
+        method=params["method"],
+        url=params["url"],
+        params=params["params"],
         data=data,
-        json=param_json,
         headers=headers,
-        cookies=cookies,
-        files=files,
-        auth=auth,
-        timeout=timeout,
-        allow_redirects=allow_redirects,
-        proxies=proxies,
-        verify=verify,
-        stream=stream,
+        cookies=params["cookies"],
+        files=params["files"],
+        auth=(username, password) if username and password else None,
+        timeout=params["timeout"],
+        allow_redirects=params["allow_redirects"],
+        proxies=params["proxies"],
+        verify=params["verify"],
+        stream=params["stream"],
         cert=cert,
     )
 
-    if resp.ok:
-        try:
-            resp_json = resp.json()
-        except:  # pylint: disable=bare-except
-            resp_json = None
 
-        history = [{"status_code": x.status_code, "url": x.url} for x in resp.history]
-        changed = bool(method in ["POST", "PUT", "PATCH", "DELETE"])
+def _write_dest(module, resp, dest_path):
+    """Stream the response body to a temporary file and move it into place at dest_path"""
+    dest_dir = os.path.dirname(dest_path) or "."
+    if not os.path.isdir(dest_dir):
+        module.fail_json(msg=f"destination directory {dest_dir} does not exist")
+    fd, tmp_path = tempfile.mkstemp(dir=module.tmpdir)
+    try:
+        with os.fdopen(fd, "wb") as dest:
+            for chunk in resp.iter_content(chunk_size=65536):
+                dest.write(chunk)
+    except (OSError, requests.RequestException) as exc:
+        os.remove(tmp_path)
+        module.fail_json(msg=f"failed to write the response body to {dest_path}: {exc}")
+    module.atomic_move(tmp_path, dest_path)
+
+
+def _body_result(module, resp):
+    """Return the body related result keys, reading only the representations that were requested"""
+    params = module.params
+    result = {}
+    if params["dest_path"]:
+        _write_dest(module, resp, params["dest_path"])
+        result.update(changed=True, dest_path=params["dest_path"])
+    elif params["return_content"] or params["return_text"] or params["return_json"]:
+        body = resp.content
+        if params["return_content"]:
+            result["content"] = base64.b64encode(body).decode("ascii")
+        if params["return_text"]:
+            result["text"] = _decode(body, resp.encoding)
+        if params["return_json"]:
+            result["json"] = _loads(body)
+    else:
+        resp.close()
+    return result
+
+
+def _exit_with_response(module, resp):
+    """Exit the module with the result for a single-URL response"""
+    method = module.params["method"]
+    verify = module.params["verify"]
+    if resp.status_code == 304:
+        # Not modified: the body is empty, so skip content/text/json entirely.
         module.exit_json(
-            changed=changed,
-            content=resp.content,
-            cookies=dict(resp.cookies),
-            elapsed=resp.elapsed.microseconds,
-            encoding=resp.encoding,
-            headers=dict(resp.headers),
-            history=history,
-            is_permanent_redirect=resp.is_permanent_redirect,
-            is_redirect=resp.is_redirect,
-            json=resp_json,
-            links=resp.links,
+            changed=False,
+            etag=resp.headers.get("ETag", module.params["etag"]),
+            last_modified=resp.headers.get("Last-Modified", module.params["last_modified"]),
             method=method,
-            next=resp.next,
             ok=resp.ok,
             reason=resp.reason,
-            text=resp.text,
             status_code=resp.status_code,
             url=resp.url,
             verify=verify,
         )
-    else:
+    if not resp.ok:
         message = f"request failed with HTTP status code {resp.status_code} and error message {resp.text}"  # pylint: disable=line-too-long
         module.fail_json(msg=message)
 
+    history = []
+    if resp.history:
+        history = [{"status_code": x.status_code, "url": x.url} for x in resp.history]
+    result = dict(
+        changed=method in _MUTATING,
+        cookies=resp.cookies.get_dict(),
+        elapsed=resp.elapsed // datetime.timedelta(microseconds=1),
+        encoding=resp.encoding,
+        etag=resp.headers.get("ETag"),
+        headers=dict(resp.headers),
+        history=history,
+        is_permanent_redirect=resp.is_permanent_redirect,
+        is_redirect=resp.is_redirect,
+        last_modified=resp.headers.get("Last-Modified"),
+        links=resp.links,
+        method=method,
+        next=resp.next,
+        ok=resp.ok,
+        reason=resp.reason,
+        status_code=resp.status_code,
+        url=resp.url,
+        verify=verify,
+    )
+    # Only materialize the body representations the caller asked for.
+    result.update(_body_result(module, resp))
+    module.exit_json(**result)
+
+
+_METHOD_CHOICES = ("GET", "POST", "OPTIONS", "HEAD", "PUT", "PATCH", "DELETE")
+_MUTATING = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+_ARGSPEC = dict(
+    method=dict(
+        required=False,
+        type=str,
+        choices=_METHOD_CHOICES,
+        default="GET",
+    ),
+    url=dict(required=True, type="raw"),
+    params=dict(required=False, type="raw", default=None),
+    data=dict(required=False, type="raw", default=None),
+    json=dict(required=False, type="json", default=None),
+    headers=dict(required=False, type="dict", default=None),
+    cookies=dict(required=False, type="dict", default=None),
+    files=dict(required=False, type="dict", default=None),
+    username=dict(required=False, type="str", default=None),
+    password=dict(required=False, type="str", default=None, no_log=True),
+    timeout=dict(required=False, type="float", default=None),
+    allow_redirects=dict(required=False, type="bool", default=True),
+    proxies=dict(required=False, type="dict", default=None),
+    verify=dict(required=False, type="bool", default=True),
+    stream=dict(required=False, type="bool", default=False),
+    cert_key=dict(required=False, type="tuple", default=None),
+    cert_file=dict(required=False, type="str", default=None),
+    etag=dict(required=False, type="str", default=None),
+    last_modified=dict(required=False, type="str", default=None),
+    return_content=dict(required=False, type="bool", default=False),
+    return_text=dict(required=False, type="bool", default=False),
+    return_json=dict(required=False, type="bool", default=False),
+    backend=dict(required=False, type="str", choices=("requests", "httpx"), default="requests"),
+    dns_cache=dict(required=False, type="bool", default=False),
+    dest_path=dict(required=False, type="path", default=None),
+)
+
+
+def main():
+    """requests-uri main function"""
+    module = AnsibleModule(
+        argument_spec=_ARGSPEC,
+        supports_check_mode=False,
+        required_together=["username", "password"],
+        mutually_exclusive=["cert_key", "cert_file"],
+    )
+    _check_params(module)
+
+    # Set on every call so an earlier dns_cache=True does not leak into later calls.
+    urllib3.util.connection.create_connection = (
+        _cached_create_connection if module.params["dns_cache"] else _CREATE_CONNECTION
+    )
+
+    data, headers = _prepare_request(module.params)
+    cert = module.params["cert_key"] or module.params["cert_file"]
+
+    if isinstance(module.params["url"], list):
+        _run_batch(module, data, headers, cert)
+    if module.params["backend"] == "httpx":
+        resp = _send_httpx(module, data, headers, cert)
+    else:
+        resp = _send_requests(module, data, headers, cert)
+    _exit_with_response(module, resp)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,70 @@
+"""
+Shared fixtures for the jtdub.requests unit tests
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+# Make the module importable as a plain module when not running under an ansible_collections tree.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "plugins", "modules"))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Small set of canned endpoints used to exercise the module"""
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve the canned GET endpoints, also when the server is used as a forward proxy"""
+        path = urlsplit(self.path).path
+        if path == "/json":
+            self._send(200, '{"a": "é"}'.encode("utf-8"), [("Content-Type", "application/json")])
+        elif path == "/cookies":
+            self._send(200, headers=[("Set-Cookie", "a=1"), ("Set-Cookie", "b=2")])
+        elif path == "/text":
+            self._send(200, "héllo".encode("latin-1"), [("Content-Type", "text/plain")])
+        elif path in ("/etag", "/etag-bare"):
+            self._conditional(path == "/etag")
+        elif path == "/echo-cookie":
+            self._send(200, self.headers.get("Cookie", "").encode("utf-8"))
+        else:
+            self._send(404)
+
+    def _conditional(self, send_validators):
+        """Answer 304 when either validator matches, otherwise 200 with an ETag and Last-Modified"""
+        validators = [("ETag", '"v1"'), ("Last-Modified", "Wed, 01 Jan 2025 00:00:00 GMT")]
+        if self.headers.get("If-None-Match") == validators[0][1] or (
+            self.headers.get("If-Modified-Since") == validators[1][1]
+        ):
+            self._send(304, headers=validators if send_validators else [])
+        else:
+            self._send(200, b"fresh", validators)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Echo the request body and content type"""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send(200, body, [("X-Content-Type", self.headers.get("Content-Type", ""))])
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    """Base URL of a local HTTP server for the duration of the test session"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
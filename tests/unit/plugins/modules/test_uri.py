@@ -0,0 +1,304 @@
+"""
+Unit tests for the jtdub.requests.uri module
+"""
+
+import base64
+import warnings
+
+import pytest
+from ansible.module_utils import basic
+from ansible.module_utils.testing import patch_module_args
+
+import uri
+
+
+class AnsibleExitJson(Exception):
+    """Raised in place of AnsibleModule.exit_json"""
+
+
+class AnsibleFailJson(Exception):
+    """Raised in place of AnsibleModule.fail_json"""
+
+
+def exit_json(self, **kwargs):  # pylint: disable=unused-argument
+    """Capture the module result instead of exiting"""
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(self, **kwargs):  # pylint: disable=unused-argument
+    """Capture the module failure instead of exiting"""
+    raise AnsibleFailJson(kwargs)
+
+
+@pytest.fixture(autouse=True)
+def patch_exit(monkeypatch):
+    """Patch exit_json and fail_json so main() returns control to the test"""
+    monkeypatch.setattr(basic.AnsibleModule, "exit_json", exit_json)
+    monkeypatch.setattr(basic.AnsibleModule, "fail_json", fail_json)
+
+
+def run_module(args, expect=AnsibleExitJson):
+    """Run main() with the given module args and return the captured result"""
+    with patch_module_args(args), pytest.raises(expect) as exc:
+        uri.main()
+    return exc.value.args[0]
+
+
+def test_get(base_url):
+    result = run_module({"url": f"{base_url}/json", "return_json": True})
+    assert result["status_code"] == 200
+    assert result["json"] == {"a": "é"}
+    assert result["changed"] is False
+
+
+def test_cert_is_none_without_cert_options(base_url, monkeypatch):
+    calls = []
+    request = uri._SESSION.request  # pylint: disable=protected-access
+
+    def capture(*args, **kwargs):
+        calls.append(kwargs)
+        return request(*args, **kwargs)
+
+    monkeypatch.setattr(uri._SESSION, "request", capture)  # pylint: disable=protected-access
+    run_module({"url": f"{base_url}/json"})
+    assert calls[0]["cert"] is None
+
+
+
+
+def test_url_must_be_string_or_list_of_strings():
+    result = run_module({"url": {"a": 1}}, expect=AnsibleFailJson)
+    assert result["msg"] == "url must be a string or a list of strings"
+
+
+def test_batch(base_url):
+    pytest.importorskip("aiohttp")
+    result = run_module({"url": [f"{base_url}/json", f"{base_url}/json"], "return_json": True})
+    assert [x["json"] for x in result["results"]] == [{"a": "é"}, {"a": "é"}]
+
+
+def test_batch_connection_error_keeps_other_results(base_url):
+    pytest.importorskip("aiohttp")
+    args = {"url": [f"{base_url}/json", "http://127.0.0.1:1/"]}
+    result = run_module(args, expect=AnsibleFailJson)
+    assert result["msg"] == "request failed for http://127.0.0.1:1/"
+    assert result["results"][0]["status_code"] == 200
+    assert result["results"][1]["ok"] is False
+    assert result["results"][1]["msg"]
+
+
+def test_batch_ssl_keeps_cert_without_verify(monkeypatch):
+    loaded = []
+    monkeypatch.setattr(uri.ssl.SSLContext, "load_cert_chain", lambda _, *args: loaded.append(args))
+    context = uri._batch_ssl(False, "client.pem")  # pylint: disable=protected-access
+    assert loaded == [("client.pem",)]
+    assert context.verify_mode == uri.ssl.CERT_NONE
+    assert uri._batch_ssl(False, None) is False  # pylint: disable=protected-access
+
+
+def test_batch_selects_proxy_by_scheme(base_url):
+    pytest.importorskip("aiohttp")
+    proxies = {"http": base_url, "https": "http://127.0.0.1:1"}
+    result = run_module({"url": ["http://example.invalid/json"], "proxies": proxies})
+    assert result["results"][0]["status_code"] == 200
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (b'{"a": 1}', {"a": 1}),
+        (b'\xef\xbb\xbf{"a": 1}', {"a": 1}),
+        (b"123456789012345678901234567890", 123456789012345678901234567890),
+        (b"-9223372036854775809", -9223372036854775809),
+        (b"not json", None),
+    ],
+)
+def test_loads(body, expected):
+    assert uri._loads(body) == expected  # pylint: disable=protected-access
+
+
+def test_loads_nan():
+    assert uri._loads(b"NaN") != uri._loads(b"NaN")  # pylint: disable=protected-access
+
+
+def test_elapsed_is_exact_microseconds(base_url, monkeypatch):
+    request = uri._SESSION.request  # pylint: disable=protected-access
+
+    def slow(*args, **kwargs):
+        resp = request(*args, **kwargs)
+        resp.elapsed = uri.datetime.timedelta(seconds=1, microseconds=1)
+        return resp
+
+    monkeypatch.setattr(uri._SESSION, "request", slow)  # pylint: disable=protected-access
+    assert run_module({"url": f"{base_url}/json"})["elapsed"] == 1_000_001
+
+
+def test_json_body(base_url):
+    args = {"url": f"{base_url}/", "method": "POST", "json": {"x": 1}}
+    result = run_module(dict(args, return_json=True))
+    assert result["json"] == {"x": 1}
+    assert result["headers"]["X-Content-Type"] == "application/json"
+    assert result["changed"] is True
+
+
+def test_json_is_ignored_with_files(base_url):
+    args = {"url": f"{base_url}/", "method": "POST", "json": {"x": 1}, "files": {"f": "payload"}}
+    result = run_module(dict(args, return_text=True))
+    assert "payload" in result["text"]
+    assert result["headers"]["X-Content-Type"].startswith("multipart/form-data")
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+def test_backends_agree(base_url, backend):
+    if backend == "httpx":
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+    cookies = run_module({"url": f"{base_url}/cookies", "backend": backend})
+    assert cookies["headers"]["Set-Cookie"] == "a=1, b=2"
+    assert cookies["cookies"] == {"a": "1", "b": "2"}
+    text = run_module({"url": f"{base_url}/text", "backend": backend, "return_text": True})
+    assert text["encoding"] == "ISO-8859-1"
+    assert text["text"] == "héllo"
+
+
+def test_httpx_sends_cookies_as_header(base_url):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    args = {"url": f"{base_url}/echo-cookie", "backend": "httpx", "return_text": True}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        result = run_module(dict(args, cookies={"a": "1"}, headers={"Cookie": "b=2"}))
+    assert result["text"] == "b=2; a=1"
+
+
+def test_dns_cache_is_reset_per_call(base_url):
+    # pylint: disable=protected-access
+    connection = uri.urllib3.util.connection
+    run_module({"url": f"{base_url}/json", "dns_cache": True})
+    assert connection.create_connection is uri._cached_create_connection
+    run_module({"url": f"{base_url}/json"})
+    assert connection.create_connection is uri._CREATE_CONNECTION
+
+
+def test_dns_cache_keeps_ipv6_scope_id(monkeypatch):
+    connected = []
+    infos = [(uri.socket.AF_INET6, uri.socket.SOCK_STREAM, 6, "", ("fe80::1", 80, 0, 3))]
+    monkeypatch.setattr(uri, "_resolve", lambda *args: infos)
+    monkeypatch.setattr(uri, "_CREATE_CONNECTION", lambda addr, *_, **__: connected.append(addr))
+    uri._cached_create_connection(("router.local", 80))  # pylint: disable=protected-access
+    assert connected == [("fe80::1%3", 80)]
+
+
+def test_dest_path(base_url, tmp_path):
+    dest = tmp_path / "out.json"
+    result = run_module({"url": f"{base_url}/json", "stream": True, "dest_path": str(dest)})
+    assert result["changed"] is True
+    assert result["dest_path"] == str(dest)
+    assert dest.read_bytes() == '{"a": "é"}'.encode("utf-8")
+
+
+def test_dest_path_requires_stream(base_url, tmp_path):
+    args = {"url": f"{base_url}/json", "dest_path": str(tmp_path / "out")}
+    result = run_module(args, AnsibleFailJson)
+    assert result["msg"].startswith("dest_path requires stream=True")
+
+
+def test_dest_path_missing_directory_fails(base_url, tmp_path):
+    dest = tmp_path / "missing" / "out.json"
+    args = {"url": f"{base_url}/json", "stream": True, "dest_path": str(dest)}
+    result = run_module(args, AnsibleFailJson)
+    assert result["msg"] == f"destination directory {dest.parent} does not exist"
+
+
+def test_dest_path_failed_transfer_leaves_no_file(base_url, tmp_path, monkeypatch):
+    def broken(self, chunk_size=1):  # pylint: disable=unused-argument
+        yield b"partial"
+        raise uri.requests.exceptions.ChunkedEncodingError("connection reset")
+
+    monkeypatch.setattr(uri.requests.Response, "iter_content", broken)
+    dest = tmp_path / "out.json"
+    args = {"url": f"{base_url}/json", "stream": True, "dest_path": str(dest)}
+    result = run_module(args, AnsibleFailJson)
+    assert "connection reset" in result["msg"]
+    assert not dest.exists()
+
+
+@pytest.mark.parametrize("option, value", [("stream", True), ("dest_path", "/tmp/out")])
+def test_httpx_rejects_streaming(base_url, option, value):
+    args = {"url": f"{base_url}/json", "backend": "httpx", option: value}
+    result = run_module(args, AnsibleFailJson)
+    assert result["msg"] == f"{option} is not supported with the httpx backend"
+
+
+def _skip_missing_backend(backend):
+    if backend == "httpx":
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+def test_200_returns_validators(base_url, backend):
+    _skip_missing_backend(backend)
+    result = run_module({"url": f"{base_url}/etag", "backend": backend})
+    assert result["status_code"] == 200
+    assert result["etag"] == '"v1"'
+    assert result["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+@pytest.mark.parametrize(
+    "validator",
+    [{"etag": '"v1"'}, {"last_modified": "Wed, 01 Jan 2025 00:00:00 GMT"}],
+)
+def test_304_not_modified(base_url, backend, validator):
+    _skip_missing_backend(backend)
+    args = {"url": f"{base_url}/etag", "backend": backend, "return_content": True}
+    result = run_module(dict(args, return_text=True, return_json=True, **validator))
+    assert result["status_code"] == 304
+    assert result["changed"] is False
+    assert result["etag"] == '"v1"'
+    assert result["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert not {"content", "text", "json"} & set(result)
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+def test_304_falls_back_to_caller_validators(base_url, backend):
+    _skip_missing_backend(backend)
+    result = run_module({"url": f"{base_url}/etag-bare", "backend": backend, "etag": '"v1"'})
+    assert result["status_code"] == 304
+    assert result["etag"] == '"v1"'
+    assert result["last_modified"] is None
+
+
+def test_content_is_omitted_by_default(base_url):
+    result = run_module({"url": f"{base_url}/json"})
+    assert "content" not in result
+
+
+def test_content_is_base64(base_url):
+    result = run_module({"url": f"{base_url}/json", "return_content": True})
+    assert result["content"] == base64.b64encode('{"a": "é"}'.encode("utf-8")).decode("ascii")
+
+
+def test_batch_content(base_url):
+    pytest.importorskip("aiohttp")
+    result = run_module({"url": [f"{base_url}/json"]})
+    assert "content" not in result["results"][0]
+    result = run_module({"url": [f"{base_url}/json"], "return_content": True})
+    expected = base64.b64encode('{"a": "é"}'.encode("utf-8")).decode("ascii")
+    assert result["results"][0]["content"] == expected
+
+
+def test_invalid_json_fails(base_url):
+    args = {"url": f"{base_url}/", "method": "POST", "json": "not json{"}
+    result = run_module(args, AnsibleFailJson)
+    assert result["msg"].startswith("json is not valid JSON")
+
+
+@pytest.mark.parametrize("backend", ["requests", "httpx"])
+def test_cookies_are_not_replayed(base_url, backend):
+    _skip_missing_backend(backend)
+    result = run_module({"url": f"{base_url}/cookies", "backend": backend})
+    assert result["cookies"] == {"a": "1", "b": "2"}
+    result = run_module({"url": f"{base_url}/echo-cookie", "backend": backend, "return_text": True})
+    assert result["text"] == ""